@@ -1,18 +1,24 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
+from collections import OrderedDict
 import pandas as pd
-import statsmodels.formula.api as sm
 import google.generativeai as genai
 import numpy as np
+import pyarrow as pa
+from scipy import stats
 from pathlib import Path
+import orjson
 import os
 
 app = FastAPI(
     title="ESS Data Analysis API",
     description="Backend API for European Social Survey data analysis with AI-powered insights",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes NumPy scalars and arrays natively, no per-request conversion walk
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware to allow frontend communication
@@ -40,22 +46,102 @@ class DataOverview(BaseModel):
 df_processed = None
 regression_results = None
 
-def convert_numpy_types(obj):
-    """Convert numpy types to Python native types for JSON serialization"""
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    elif pd.isna(obj):
+# Shared Gemini model, created once the API key has been configured
+gemini_model = None
+
+# LRU cache of Gemini answers keyed by (research_depth, message). The data behind the
+# prompts is immutable once loaded, so identical questions get identical context.
+ai_response_cache = OrderedDict()
+AI_CACHE_SIZE = 512
+
+# Pre-serialized JSON bodies of the read-only endpoints
+overview_cache = None
+distributions_cache = None
+country_cache = None
+demographics_cache = None
+regression_cache = None
+
+# Data files: the raw Stata export and the cleaned Arrow IPC sidecar written on first load.
+# The sidecar is uncompressed so every worker can memory-map the same pages.
+DATA_FILE = "ESS11.dta"
+CACHE_FILE = "ESS11.arrow"
+
+# Rows decoded per chunk when streaming the Stata file
+STATA_CHUNKSIZE = 100_000
+
+# Columns kept in the processed DataFrame (and in the Arrow sidecar)
+REQUIRED_VARS = ['impcntr', 'lrscale', 'hincfel', 'eisced', 'aesfdrk', 'agea', 'gndr', 'cntry']
+CACHED_COLUMNS = REQUIRED_VARS + ['gender_female', 'age_group', 'education_group',
+                                  'income_group', 'political_group', 'immigration_group']
+
+# Small-domain survey codes, downcast once they have been validated. aesfdrk is not
+# validated and may be missing, so it keeps a float dtype to hold NaN.
+CODED_DTYPES = {'impcntr': 'int8', 'lrscale': 'int8', 'hincfel': 'int8',
+                'eisced': 'int8', 'gndr': 'int8', 'agea': 'int8', 'aesfdrk': 'float32'}
+
+def load_cached_data():
+    """Memory-map the cleaned data from the Arrow sidecar if it is newer than the Stata file"""
+    cache_path = Path(CACHE_FILE)
+    if not cache_path.exists():
+        return None
+    
+    data_path = Path(DATA_FILE)
+    if data_path.exists() and data_path.stat().st_mtime > cache_path.stat().st_mtime:
+        return None
+    
+    try:
+        table = pa.ipc.open_file(pa.memory_map(str(cache_path))).read_all().select(CACHED_COLUMNS)
+        # split_blocks keeps null-free numeric columns as views on the mapped pages
+        # (shared through the page cache across workers) instead of consolidating copies
+        df = table.to_pandas(split_blocks=True)
+        df.attrs = orjson.loads(table.schema.metadata[b'attrs'])
+        return df
+    except Exception:
+        # Unreadable or outdated sidecar, fall back to the Stata file
         return None
-    else:
-        return obj
+
+def save_cached_data(df):
+    """Write the cleaned data to the Arrow sidecar for faster cold starts"""
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, b'attrs': orjson.dumps(df.attrs)})
+        
+        # Write to a temporary file first so other workers never map a partial file
+        tmp_path = f"{CACHE_FILE}.tmp{os.getpid()}"
+        with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, CACHE_FILE)
+    except Exception:
+        # The cache is an optimisation only; serve from memory if it cannot be written
+        pass
+
+def bin_codes(values, edges, labels):
+    """Bin validated codes into right-closed groups (same result as pd.cut with these inner edges)"""
+    codes = np.searchsorted(edges, values.to_numpy(), side='left')
+    return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+def filter_valid_rows(df):
+    """Keep the rows with valid codes on all analysis variables, stored with compact dtypes"""
+    # Build one fused mask over the raw arrays and slice once.
+    # NaN compares False, so missing codes are dropped too.
+    impcntr = df['impcntr'].to_numpy()
+    lrscale = df['lrscale'].to_numpy()
+    hincfel = df['hincfel'].to_numpy()
+    eisced = df['eisced'].to_numpy()
+    agea = df['agea'].to_numpy()
+    gndr = df['gndr'].to_numpy()
+    
+    mask = (
+        (impcntr >= 1) & (impcntr <= 4) &      # Valid impcntr values (1-4)
+        (lrscale >= 0) & (lrscale <= 10) &     # Valid lrscale values (0-10)
+        (hincfel >= 1) & (hincfel <= 4) &      # Valid hincfel values (1-4)
+        (eisced >= 1) & (eisced <= 7) &        # Valid eisced values (1-7)
+        (agea >= 16) & (agea <= 100) &         # Valid agea values (16-100)
+        ((gndr == 1) | (gndr == 2)) &          # Valid gender values (1-2)
+        df['cntry'].notna().to_numpy()
+    )
+    
+    return df.loc[mask, REQUIRED_VARS].astype(CODED_DTYPES)
 
 def load_and_prepare_data():
     """Load and prepare ESS data with comprehensive preprocessing"""
@@ -65,80 +151,145 @@ def load_and_prepare_data():
         return df_processed
     
     try:
+        df = load_cached_data()
+        if df is not None:
+            build_response_caches(df)
+            df_processed = df
+            return df
+        
         # Load the Stata file
-        file_path = "ESS11.dta"
+        file_path = DATA_FILE
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Data file {file_path} not found")
         
-        # Read data with convert_categoricals=False to avoid the prtvtbrs error
-        df = pd.read_stata(file_path, convert_categoricals=False)
-        
-        # Check if required variables exist
-        required_vars = ['impcntr', 'lrscale', 'hincfel', 'eisced', 'aesfdrk', 'agea', 'gndr', 'cntry']
-        missing_vars = [var for var in required_vars if var not in df.columns]
-        if missing_vars:
-            raise ValueError(f"Missing required variables: {missing_vars}")
-        
-        # Initial data info
-        initial_shape = df.shape
-        initial_missing = df.isnull().sum()
-        
-        # Data cleaning and validation
-        # Filter for valid impcntr values (1-4)
-        df = df[df['impcntr'].isin([1, 2, 3, 4])]
-        
-        # Filter for valid lrscale values (0-10)
-        df = df[df['lrscale'].isin(range(11))]
-        
-        # Validate hincfel (1-4)
-        df = df[df['hincfel'].isin([1, 2, 3, 4])]
-        
-        # Validate eisced (1-7)
-        df = df[df['eisced'].isin(range(1, 8))]
-        
-        # Validate agea (16-100)
-        df = df[(df['agea'] >= 16) & (df['agea'] <= 100)]
+        # Stream only the analysis variables, chunk by chunk, validating each chunk as it
+        # is read. convert_categoricals=False avoids the prtvtbrs error.
+        required_vars = REQUIRED_VARS
+        with pd.read_stata(file_path, convert_categoricals=False, columns=required_vars,
+                           chunksize=STATA_CHUNKSIZE) as reader:
+            # Check if required variables exist
+            source_vars = reader.variable_labels()
+            missing_vars = [var for var in required_vars if var not in source_vars]
+            if missing_vars:
+                raise ValueError(f"Missing required variables: {missing_vars}")
+            
+            chunks = [filter_valid_rows(chunk) for chunk in reader]
         
-        # Validate gender (1-2)
-        df = df[df['gndr'].isin([1, 2])]
+        df = pd.concat(chunks)
+        total_variables = len(source_vars)
         
-        # Drop rows with missing values in key variables
-        df = df.dropna(subset=['impcntr', 'lrscale', 'hincfel', 'eisced', 'agea', 'gndr', 'cntry'])
+        # Categories are set after concatenation so every chunk shares them
+        df['cntry'] = df['cntry'].astype('category')
         
         # Data transformation and feature engineering
-        df['gender_female'] = (df['gndr'] == 2).astype(int)
+        df['gender_female'] = (df['gndr'] == 2).astype('int8')
         
         # Create age groups
-        df['age_group'] = pd.cut(df['agea'], 
-                                bins=[0, 24, 34, 49, 64, 100], 
-                                labels=['18-24', '25-34', '35-49', '50-64', '65+'])
+        df['age_group'] = bin_codes(df['agea'], [24, 34, 49, 64],
+                                    ['18-24', '25-34', '35-49', '50-64', '65+'])
         
         # Create education groups
-        df['education_group'] = pd.cut(df['eisced'], 
-                                     bins=[0, 2, 5, 7], 
-                                     labels=['Low', 'Medium', 'High'])
+        df['education_group'] = bin_codes(df['eisced'], [2, 5], ['Low', 'Medium', 'High'])
         
         # Create income groups
-        df['income_group'] = pd.cut(df['hincfel'], 
-                                  bins=[0, 2, 4], 
-                                  labels=['Low', 'High'])
+        df['income_group'] = bin_codes(df['hincfel'], [2], ['Low', 'High'])
         
         # Create political groups
-        df['political_group'] = pd.cut(df['lrscale'], 
-                                     bins=[-1, 3, 6, 10], 
-                                     labels=['Left', 'Center', 'Right'])
+        df['political_group'] = bin_codes(df['lrscale'], [3, 6], ['Left', 'Center', 'Right'])
         
         # Create immigration groups
-        df['immigration_group'] = pd.cut(df['impcntr'], 
-                                       bins=[0, 2, 4], 
-                                       labels=['Liberal', 'Restrictive'])
+        df['immigration_group'] = bin_codes(df['impcntr'], [2], ['Liberal', 'Restrictive'])
+        
+        # Variable count before pruning (source plus derived), reported by the data overview
+        df.attrs['total_variables'] = total_variables + len(CACHED_COLUMNS) - len(required_vars)
         
+        save_cached_data(df)
+        build_response_caches(df)
         df_processed = df
         return df
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading data: {str(e)}")
 
+def fit_ols(df, numeric_cols, categorical=None):
+    """Fit an OLS model of impcntr with an intercept by least squares, with statsmodels-style diagnostics"""
+    # Listwise deletion of incomplete rows, as the formula interface did
+    data = df.dropna(subset=numeric_cols)
+    y = data['impcntr'].to_numpy(np.float64)
+    
+    # Design matrix: intercept, treatment-coded categorical dummies, numeric regressors.
+    # Filled in place in one column-major (LAPACK layout) array, no intermediate frames.
+    levels = []
+    if categorical is not None:
+        cat = pd.Categorical(data[categorical])
+        codes = cat.codes
+        levels = list(cat.categories[1:])
+    names = ['Intercept'] + [f"C({categorical})[T.{level}]" for level in levels] + numeric_cols
+    
+    X = np.zeros((len(data), len(names)), dtype=np.float64, order='F')
+    X[:, 0] = 1.0
+    if levels:
+        # The first level is the reference category and has no column
+        rows = np.flatnonzero(codes > 0)
+        X[rows, codes[rows]] = 1.0
+    for j, col in enumerate(numeric_cols, start=1 + len(levels)):
+        X[:, j] = data[col].to_numpy()
+    
+    beta, _, rank, _ = np.linalg.lstsq(X, y, rcond=None)
+    resid = y - X @ beta
+    
+    nobs = len(y)
+    df_model = rank - 1
+    df_resid = nobs - rank
+    rss = resid @ resid
+    tss = ((y - y.mean()) ** 2).sum()
+    
+    rsquared = 1 - rss / tss
+    fvalue = ((tss - rss) / df_model) / (rss / df_resid)
+    llf = -nobs / 2 * (np.log(2 * np.pi) + np.log(rss / nobs) + 1)
+    
+    # Standard errors from the (pseudo-)inverse of X'X, then two-sided t-tests
+    bse = np.sqrt(np.diag(np.linalg.pinv(X.T @ X)) * rss / df_resid)
+    tvalues = beta / bse
+    
+    return {
+        'nobs': nobs,
+        'df_model': df_model,
+        'df_resid': df_resid,
+        'rsquared': rsquared,
+        'rsquared_adj': 1 - (1 - rsquared) * (nobs - 1) / df_resid,
+        'fvalue': fvalue,
+        'f_pvalue': stats.f.sf(fvalue, df_model, df_resid),
+        'aic': -2 * llf + 2 * rank,
+        'bic': -2 * llf + np.log(nobs) * rank,
+        'params': pd.Series(beta, index=names),
+        'bse': pd.Series(bse, index=names),
+        'tvalues': pd.Series(tvalues, index=names),
+        'pvalues': pd.Series(2 * stats.t.sf(np.abs(tvalues), df_resid), index=names)
+    }
+
+def format_model_summary(model):
+    """Plain-text summary table of a fitted model, shown in the regression results panel"""
+    width = 78
+    lines = [
+        'OLS Regression Results'.center(width),
+        '=' * width,
+        f"{'Dep. Variable:':<20}{'impcntr':>18}   {'R-squared:':<20}{model['rsquared']:>17.3f}",
+        f"{'Model:':<20}{'OLS':>18}   {'Adj. R-squared:':<20}{model['rsquared_adj']:>17.3f}",
+        f"{'No. Observations:':<20}{model['nobs']:>18}   {'F-statistic:':<20}{model['fvalue']:>17.2f}",
+        f"{'Df Residuals:':<20}{model['df_resid']:>18}   {'Prob (F-statistic):':<20}{model['f_pvalue']:>17.3g}",
+        f"{'Df Model:':<20}{model['df_model']:>18}   {'AIC:':<20}{model['aic']:>17.1f}",
+        f"{'':<20}{'':>18}   {'BIC:':<20}{model['bic']:>17.1f}",
+        '=' * width,
+        f"{'':<30}{'coef':>12}{'std err':>12}{'t':>12}{'P>|t|':>12}",
+        '-' * width
+    ]
+    for name in model['params'].index:
+        lines.append(f"{name:<30}{model['params'][name]:>12.4f}{model['bse'][name]:>12.4f}"
+                     f"{model['tvalues'][name]:>12.3f}{model['pvalues'][name]:>12.3f}")
+    lines.append('=' * width)
+    return '\n'.join(lines)
+
 def run_regression(df):
     """Run regression analysis with comprehensive diagnostics"""
     global regression_results
@@ -150,43 +301,40 @@ def run_regression(df):
         # Data quality checks
         # Outlier detection using IQR method
         numerical_cols = ['impcntr', 'lrscale', 'hincfel', 'eisced', 'agea']
-        outliers_info = {}
         
-        for col in numerical_cols:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-            outliers_info[col] = len(outliers)
+        # All columns at once: quartiles per column, bounds broadcast across rows
+        values = df[numerical_cols].to_numpy()
+        Q1, Q3 = np.quantile(values, [0.25, 0.75], axis=0)
+        IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+        outliers = (values < lower_bound) | (values > upper_bound)
+        outliers_info = dict(zip(numerical_cols, outliers.sum(axis=0).tolist()))
         
         # Correlation matrix
         correlation_matrix = df[numerical_cols].corr().round(3).to_dict()
         
         # Run regression
-        model_formula = "impcntr ~ lrscale + hincfel + eisced + aesfdrk + agea + gender_female + C(cntry)"
-        
         try:
-            model = sm.ols(model_formula, data=df).fit()
+            model = fit_ols(df, ['lrscale', 'hincfel', 'eisced', 'aesfdrk', 'agea', 'gender_female'],
+                            categorical='cntry')
         except:
             # Fallback to simpler model if the primary regression fails
-            model_formula = "impcntr ~ lrscale + agea + gender_female"
-            model = sm.ols(model_formula, data=df).fit()
+            model = fit_ols(df, ['lrscale', 'agea', 'gender_female'])
         
         # Model diagnostics
         diagnostics = {
-            'r_squared': round(model.rsquared, 4),
-            'adj_r_squared': round(model.rsquared_adj, 4),
-            'f_statistic': round(model.fvalue, 2),
-            'f_pvalue': round(model.f_pvalue, 4),
-            'aic': round(model.aic, 2),
-            'bic': round(model.bic, 2)
+            'r_squared': round(model['rsquared'], 4),
+            'adj_r_squared': round(model['rsquared_adj'], 4),
+            'f_statistic': round(model['fvalue'], 2),
+            'f_pvalue': round(model['f_pvalue'], 4),
+            'aic': round(model['aic'], 2),
+            'bic': round(model['bic'], 2)
         }
         
         # Coefficients and p-values
-        coefficients = model.params.round(4).to_dict()
-        p_values = model.pvalues.round(4).to_dict()
+        coefficients = model['params'].round(4).to_dict()
+        p_values = model['pvalues'].round(4).to_dict()
         
         regression_results = {
             'outliers': outliers_info,
@@ -194,14 +342,164 @@ def run_regression(df):
             'diagnostics': diagnostics,
             'coefficients': coefficients,
             'p_values': p_values,
-            'model_summary': str(model.summary())
+            'model_summary': format_model_summary(model)
         }
         
-        return convert_numpy_types(regression_results)
+        return regression_results
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error running regression: {str(e)}")
 
+def compute_data_overview(df):
+    """Compute data quality overview and metrics"""
+    # Share of non-missing values per key variable, in a single pass over the columns
+    completeness_cols = ['impcntr', 'lrscale', 'hincfel', 'eisced', 'agea', 'gndr']
+    completeness = (df[completeness_cols].notna().mean(axis=0) * 100).round(1).to_dict()
+    
+    overview = {
+        'total_observations': len(df),
+        'total_variables': df.attrs.get('total_variables', len(df.columns)),
+        'total_countries': df['cntry'].nunique(),
+        'age_range': f"{int(df['agea'].min())}-{int(df['agea'].max())}",
+        'completeness': completeness
+    }
+    
+    return overview
+
+def compute_data_distributions(df):
+    """Compute distribution data for charts"""
+    # Validated codes are small non-negative integers, so one bincount pass per
+    # variable yields the full fixed-length histogram (absent codes count 0)
+    
+    # Immigration attitudes distribution (1-4)
+    immigration_dist = np.bincount(df['impcntr'].to_numpy(np.intp), minlength=5)[1:5].tolist()
+    
+    # Political orientation distribution (0-10)
+    political_dist = np.bincount(df['lrscale'].to_numpy(np.intp), minlength=11)[0:11].tolist()
+    
+    # Age distribution (16-100)
+    age_dist = np.bincount(df['agea'].to_numpy(np.intp), minlength=101)[16:101].tolist()
+    
+    # Education distribution (1-7)
+    education_dist = np.bincount(df['eisced'].to_numpy(np.intp), minlength=8)[1:8].tolist()
+    
+    distributions = {
+        'immigration': immigration_dist,
+        'political': political_dist,
+        'age': age_dist,
+        'education': education_dist
+    }
+    
+    return distributions
+
+def grouped_mean_std(codes, values, n_groups):
+    """Per-group count, mean and sample std of values, grouped on integer codes with np.bincount"""
+    # Sums and sums of squares are accumulated in one pass each, with no per-row
+    # deviations array. The survey values are small integers, so both sums are
+    # exact in float64 and the shortcut variance formula loses no precision.
+    counts = np.bincount(codes, minlength=n_groups)
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    squares = np.bincount(codes, weights=values * values, minlength=n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Empty groups give NaN, single-observation groups a NaN std, as in pandas
+        means = sums / counts
+        stds = np.sqrt((squares - sums * means) / (counts - 1))
+    return counts, means, stds
+
+def compute_country_analysis(df):
+    """Compute country-level statistics"""
+    # Aggregate on the integer country codes, labels are attached to the result only
+    cntry = df['cntry'].cat
+    codes = cntry.codes.to_numpy()
+    n_groups = len(cntry.categories)
+    counts, impcntr_mean, impcntr_std = grouped_mean_std(codes, df['impcntr'].to_numpy(np.float64), n_groups)
+    _, lrscale_mean, lrscale_std = grouped_mean_std(codes, df['lrscale'].to_numpy(np.float64), n_groups)
+    _, agea_mean, agea_std = grouped_mean_std(codes, df['agea'].to_numpy(np.float64), n_groups)
+    
+    country_stats = {}
+    for i, country in enumerate(cntry.categories):
+        if counts[i] == 0:
+            continue
+        country_stats[country] = {
+            'impcntr': {
+                'mean': round(impcntr_mean[i], 2),
+                'std': round(impcntr_std[i], 2),
+                'count': counts[i]
+            },
+            'lrscale': {
+                'mean': round(lrscale_mean[i], 2),
+                'std': round(lrscale_std[i], 2)
+            },
+            'agea': {
+                'mean': round(agea_mean[i], 1),
+                'std': round(agea_std[i], 1)
+            }
+        }
+    
+    return country_stats
+
+def summarize_impcntr_by(df, column, labels=None):
+    """Mean, std and count of immigration attitudes per group of a column, keyed by group label"""
+    if labels is None:
+        # Categorical column: compute on its integer codes
+        codes = df[column].cat.codes.to_numpy()
+        labels = df[column].cat.categories
+    else:
+        # Integer-coded column whose values index into labels
+        codes = df[column].to_numpy(np.intp)
+    
+    counts, means, stds = grouped_mean_std(codes, df['impcntr'].to_numpy(np.float64), len(labels))
+    return {
+        label: {
+            'mean': round(means[i], 2),
+            'std': round(stds[i], 2),
+            'count': counts[i]
+        } for i, label in enumerate(labels)
+    }
+
+def compute_demographics_analysis(df):
+    """Compute demographic breakdowns"""
+    demographics = {
+        'gender': summarize_impcntr_by(df, 'gender_female', ['male', 'female']),
+        'age_groups': summarize_impcntr_by(df, 'age_group'),
+        'education': summarize_impcntr_by(df, 'education_group'),
+        'political': summarize_impcntr_by(df, 'political_group')
+    }
+    
+    return demographics
+
+def serialize_json(content):
+    """Serialize a response body to JSON bytes once, NumPy values included"""
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def json_response(body):
+    """Return pre-serialized JSON bytes as-is, skipping per-request encoding"""
+    return Response(content=body, media_type="application/json")
+
+def build_response_caches(df):
+    """Precompute the responses of the read-only endpoints, the data is immutable after load"""
+    global overview_cache, distributions_cache, country_cache, demographics_cache
+    
+    overview_cache = serialize_json(compute_data_overview(df))
+    distributions_cache = serialize_json(compute_data_distributions(df))
+    country_cache = serialize_json(compute_country_analysis(df))
+    demographics_cache = serialize_json(compute_demographics_analysis(df))
+
+def get_gemini_model():
+    """Configure the Gemini API once and return the shared model, or None without an API key"""
+    global gemini_model
+    
+    if gemini_model is not None:
+        return gemini_model
+    
+    api_key = os.getenv('GEMINI_API_KEY')
+    if not api_key:
+        return None
+    
+    genai.configure(api_key=api_key)
+    gemini_model = genai.GenerativeModel('gemini-pro')
+    return gemini_model
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -211,34 +509,21 @@ async def root():
 async def get_data_overview():
     """Get data quality overview and metrics"""
     try:
-        df = load_and_prepare_data()
-        
-        overview = {
-            'total_observations': len(df),
-            'total_variables': len(df.columns),
-            'total_countries': df['cntry'].nunique(),
-            'age_range': f"{int(df['agea'].min())}-{int(df['agea'].max())}",
-            'completeness': {
-                'impcntr': round(df['impcntr'].notna().sum() / len(df) * 100, 1),
-                'lrscale': round(df['lrscale'].notna().sum() / len(df) * 100, 1),
-                'hincfel': round(df['hincfel'].notna().sum() / len(df) * 100, 1),
-                'eisced': round(df['eisced'].notna().sum() / len(df) * 100, 1),
-                'agea': round(df['agea'].notna().sum() / len(df) * 100, 1),
-                'gndr': round(df['gndr'].notna().sum() / len(df) * 100, 1)
-            }
-        }
-        
-        return convert_numpy_types(overview)
+        load_and_prepare_data()
+        return json_response(overview_cache)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/regression-analysis")
 async def get_regression_analysis():
     """Get regression results and diagnostics"""
+    global regression_cache
+    
     try:
-        df = load_and_prepare_data()
-        results = run_regression(df)
-        return convert_numpy_types(results)
+        if regression_cache is None:
+            df = load_and_prepare_data()
+            regression_cache = serialize_json(run_regression(df))
+        return json_response(regression_cache)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -246,32 +531,8 @@ async def get_regression_analysis():
 async def get_data_distributions():
     """Get distribution data for charts"""
     try:
-        df = load_and_prepare_data()
-        
-        # Immigration attitudes distribution (1-4)
-        immigration_counts = df['impcntr'].value_counts().sort_index()
-        immigration_dist = [immigration_counts.get(i, 0) for i in range(1, 5)]
-        
-        # Political orientation distribution (0-10)
-        political_counts = df['lrscale'].value_counts().sort_index()
-        political_dist = [political_counts.get(i, 0) for i in range(11)]
-        
-        # Age distribution (16-100)
-        age_counts = df['agea'].value_counts().sort_index()
-        age_dist = [age_counts.get(i, 0) for i in range(16, 101)]
-        
-        # Education distribution (1-7)
-        education_counts = df['eisced'].value_counts().sort_index()
-        education_dist = [education_counts.get(i, 0) for i in range(1, 8)]
-        
-        distributions = {
-            'immigration': immigration_dist,
-            'political': political_dist,
-            'age': age_dist,
-            'education': education_dist
-        }
-        
-        return convert_numpy_types(distributions)
+        load_and_prepare_data()
+        return json_response(distributions_cache)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -279,28 +540,8 @@ async def get_data_distributions():
 async def get_country_analysis():
     """Get country-level statistics"""
     try:
-        df = load_and_prepare_data()
-        
-        country_stats = {}
-        for country in sorted(df['cntry'].unique()):
-            country_data = df[df['cntry'] == country]
-            country_stats[country] = {
-                'impcntr': {
-                    'mean': round(country_data['impcntr'].mean(), 2),
-                    'std': round(country_data['impcntr'].std(), 2),
-                    'count': len(country_data)
-                },
-                'lrscale': {
-                    'mean': round(country_data['lrscale'].mean(), 2),
-                    'std': round(country_data['lrscale'].std(), 2)
-                },
-                'agea': {
-                    'mean': round(country_data['agea'].mean(), 1),
-                    'std': round(country_data['agea'].std(), 1)
-                }
-            }
-        
-        return convert_numpy_types(country_stats)
+        load_and_prepare_data()
+        return json_response(country_cache)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -308,72 +549,8 @@ async def get_country_analysis():
 async def get_demographics_analysis():
     """Get demographic breakdowns"""
     try:
-        df = load_and_prepare_data()
-        
-        # Gender analysis
-        male_data = df[df['gndr'] == 1]
-        female_data = df[df['gndr'] == 2]
-        
-        # Age groups analysis
-        age_groups = {
-            '18-24': df[df['age_group'] == '18-24'],
-            '25-34': df[df['age_group'] == '25-34'],
-            '35-49': df[df['age_group'] == '35-49'],
-            '50-64': df[df['age_group'] == '50-64'],
-            '65+': df[df['age_group'] == '65+']
-        }
-        
-        # Education groups analysis
-        education_groups = {
-            'Low': df[df['education_group'] == 'Low'],
-            'Medium': df[df['education_group'] == 'Medium'],
-            'High': df[df['education_group'] == 'High']
-        }
-        
-        # Political groups analysis
-        political_groups = {
-            'Left': df[df['political_group'] == 'Left'],
-            'Center': df[df['political_group'] == 'Center'],
-            'Right': df[df['political_group'] == 'Right']
-        }
-        
-        demographics = {
-            'gender': {
-                'male': {
-                    'mean': round(male_data['impcntr'].mean(), 2),
-                    'std': round(male_data['impcntr'].std(), 2),
-                    'count': len(male_data)
-                },
-                'female': {
-                    'mean': round(female_data['impcntr'].mean(), 2),
-                    'std': round(female_data['impcntr'].std(), 2),
-                    'count': len(female_data)
-                }
-            },
-            'age_groups': {
-                group: {
-                    'mean': round(data['impcntr'].mean(), 2),
-                    'std': round(data['impcntr'].std(), 2),
-                    'count': len(data)
-                } for group, data in age_groups.items()
-            },
-            'education': {
-                level: {
-                    'mean': round(data['impcntr'].mean(), 2),
-                    'std': round(data['impcntr'].std(), 2),
-                    'count': len(data)
-                } for level, data in education_groups.items()
-            },
-            'political': {
-                orientation: {
-                    'mean': round(data['impcntr'].mean(), 2),
-                    'std': round(data['impcntr'].std(), 2),
-                    'count': len(data)
-                } for orientation, data in political_groups.items()
-            }
-        }
-        
-        return convert_numpy_types(demographics)
+        load_and_prepare_data()
+        return json_response(demographics_cache)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -383,24 +560,21 @@ async def get_scatter_data():
     try:
         df = load_and_prepare_data()
         
-        # Sample data for better performance (max 2000 points)
-        if len(df) > 2000:
-            df_sample = df.sample(n=2000, random_state=42)
-        else:
-            df_sample = df
-        
-        scatter_data = []
-        for _, row in df_sample.iterrows():
-            scatter_data.append({
-                'x': float(row['lrscale']),
-                'y': float(row['impcntr']),
-                'age': int(row['agea']),
-                'country': str(row['cntry']),
-                'gender': str(row['gndr']),
-                'education': int(row['eisced'])
-            })
-        
-        return convert_numpy_types({'data': scatter_data})
+        # Sample row positions for better performance (max 2000 points)
+        n_points = min(2000, len(df))
+        idx = np.random.default_rng(42).choice(len(df), size=n_points, replace=False)
+        
+        # Column-wise payload: one list per field instead of one dict per point
+        scatter_data = {
+            'x': df['lrscale'].to_numpy()[idx].astype(np.float32).tolist(),
+            'y': df['impcntr'].to_numpy()[idx].astype(np.float32).tolist(),
+            'age': df['agea'].to_numpy()[idx].tolist(),
+            'country': df['cntry'].take(idx).tolist(),
+            'gender': df['gndr'].to_numpy()[idx].astype(str).tolist(),
+            'education': df['eisced'].to_numpy()[idx].tolist()
+        }
+        
+        return {'data': scatter_data}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -408,13 +582,19 @@ async def get_scatter_data():
 async def ai_assistant(request: AIRequest):
     """Handle AI chat requests with Gemini"""
     try:
-        # Configure Gemini API (you'll need to set your API key)
-        api_key = os.getenv('GEMINI_API_KEY')
-        if not api_key:
+        # Gemini is configured on first use (you'll need to set your API key)
+        model = get_gemini_model()
+        if model is None:
             return {"response": "Gemini API key not configured. Please set GEMINI_API_KEY environment variable.", "research_depth": request.research_depth}
         
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-pro')
+        # Serve repeated questions from the cache instead of another Gemini round-trip
+        cache_key = (request.research_depth, request.message)
+        if cache_key in ai_response_cache:
+            ai_response_cache.move_to_end(cache_key)
+            return {
+                "response": ai_response_cache[cache_key],
+                "research_depth": request.research_depth
+            }
         
         # Get current data context
         df = load_and_prepare_data()
@@ -472,8 +652,12 @@ Provide comprehensive analysis including:
 4. Methodological considerations
 5. Future research directions"""
         
-        # Generate response
-        response = model.generate_content(base_prompt)
+        # Generate response without blocking the event loop during the API round-trip
+        response = await model.generate_content_async(base_prompt)
+        
+        ai_response_cache[cache_key] = response.text
+        if len(ai_response_cache) > AI_CACHE_SIZE:
+            ai_response_cache.popitem(last=False)
         
         return {
             "response": response.text,
@@ -478,18 +478,20 @@ function createDemographicsCharts() {
 function createScatterPlot() {
     if (!currentData.scatterData) return;
     
-    const scatterData = currentData.scatterData.map(point => ({
-        x: point.x,
-        y: point.y,
+    // Scatter data arrives column-wise: one array per field, aligned by index
+    const points = currentData.scatterData;
+    const scatterData = points.x.map((x, i) => ({
+        x: x,
+        y: points.y[i],
         mode: 'markers',
         type: 'scatter',
-        name: point.country,
+        name: points.country[i],
         marker: {
-            size: point.age / 10,
+            size: points.age[i] / 10,
             opacity: 0.7,
             color: Math.random() * 360
         },
-        text: `Country: ${point.country}<br>Age: ${point.age}<br>Political: ${point.x}<br>Immigration: ${point.y}`,
+        text: `Country: ${points.country[i]}<br>Age: ${points.age[i]}<br>Political: ${x}<br>Immigration: ${points.y[i]}`,
         hoverinfo: 'text'
     }));
     